@@ -10,7 +10,9 @@ extern crate dict_derive;
 use dict_derive::{FromPyObject, IntoPyObject};
 
 extern crate pyo3;
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
 use pyo3::wrap_pyfunction;
 
 extern crate pyo3_log;
@@ -177,12 +179,22 @@ impl FromIndex<GridAutoFlow> for GridAutoFlow {
     }
 }
 
-#[derive(FromPyObject, IntoPyObject)]
+// Lengths are passed from Python as flat `(dim, value)` tuples (see
+// `LengthBase.to_tuple()`), sizes and rects as the concatenation of these.
+// Results passed back to Python (eg. available space for `measure`) are dicts.
+#[derive(IntoPyObject)]
 struct PyLength {
     dim: i32,
     value: f32,
 }
 
+impl<'py> pyo3::FromPyObject<'py> for PyLength {
+    fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
+        let (dim, value): (i32, f32) = ob.extract()?;
+        Ok(PyLength { dim, value })
+    }
+}
+
 impl Into<PyLength> for AvailableSpace {
     fn into(self: AvailableSpace) -> PyLength {
         match self {
@@ -239,12 +251,21 @@ impl From<PyLength> for LengthPercentage {
     }
 }
 
-#[derive(FromPyObject, IntoPyObject)]
 pub struct PySize {
     width: PyLength,
     height: PyLength,
 }
 
+impl<'py> pyo3::FromPyObject<'py> for PySize {
+    fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
+        let (width_dim, width, height_dim, height): (i32, f32, i32, f32) = ob.extract()?;
+        Ok(PySize {
+            width: PyLength { dim: width_dim, value: width },
+            height: PyLength { dim: height_dim, value: height },
+        })
+    }
+}
+
 impl From<PySize> for Size<Dimension> {
     fn from(size: PySize) -> Self {
         Size {
@@ -272,7 +293,6 @@ impl From<PySize> for Size<AvailableSpace> {
     }
 }
 
-#[derive(FromPyObject, IntoPyObject)]
 pub struct PyRect {
     left: PyLength,
     right: PyLength,
@@ -280,6 +300,27 @@ pub struct PyRect {
     bottom: PyLength,
 }
 
+impl<'py> pyo3::FromPyObject<'py> for PyRect {
+    fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
+        let (top_dim, top, right_dim, right, bottom_dim, bottom, left_dim, left): (
+            i32,
+            f32,
+            i32,
+            f32,
+            i32,
+            f32,
+            i32,
+            f32,
+        ) = ob.extract()?;
+        Ok(PyRect {
+            left: PyLength { dim: left_dim, value: left },
+            right: PyLength { dim: right_dim, value: right },
+            top: PyLength { dim: top_dim, value: top },
+            bottom: PyLength { dim: bottom_dim, value: bottom },
+        })
+    }
+}
+
 impl From<PyRect> for Rect<LengthPercentage> {
     fn from(rect: PyRect) -> Rect<LengthPercentage> {
         Rect {
@@ -313,7 +354,7 @@ impl From<PyRect> for Rect<Dimension> {
     }
 }
 
-#[derive(FromPyObject, IntoPyObject)]
+#[derive(IntoPyObject)]
 pub struct PyGridIndex {
     kind: i8,
     value: i16,
@@ -329,7 +370,7 @@ impl From<PyGridIndex> for GridPlacement {
     }
 }
 
-#[derive(FromPyObject, IntoPyObject)]
+#[derive(IntoPyObject)]
 pub struct PyGridPlacement {
     start: PyGridIndex,
     end: PyGridIndex,
@@ -344,12 +385,22 @@ impl From<PyGridPlacement> for Line<GridPlacement> {
     }
 }
 
-#[derive(FromPyObject, IntoPyObject)]
+#[derive(IntoPyObject)]
 pub struct PyGridTrackSize {
     min_size: PyLength,
     max_size: PyLength,
 }
 
+impl<'py> pyo3::FromPyObject<'py> for PyGridTrackSize {
+    fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
+        let (min_dim, min, max_dim, max): (i32, f32, i32, f32) = ob.extract()?;
+        Ok(PyGridTrackSize {
+            min_size: PyLength { dim: min_dim, value: min },
+            max_size: PyLength { dim: max_dim, value: max },
+        })
+    }
+}
+
 impl From<PyGridTrackSize> for NonRepeatedTrackSizingFunction {
     fn from(size: PyGridTrackSize) -> NonRepeatedTrackSizingFunction {
         NonRepeatedTrackSizingFunction {
@@ -373,22 +424,31 @@ impl FromIndex<GridTrackRepetition> for GridTrackRepetition {
     }
 }
 
-#[derive(FromPyObject, IntoPyObject)]
+// Passed from Python as `(repetition, tracks)`, where a repetition of -2
+// denotes a single (non-repeated) track
 pub struct PyGridTrackSizing {
     repetition: i32,
-    single: Option<PyGridTrackSize>,
-    repeat: Vec<PyGridTrackSize>,
+    tracks: Vec<PyGridTrackSize>,
+}
+
+impl<'py> pyo3::FromPyObject<'py> for PyGridTrackSizing {
+    fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
+        let (repetition, tracks): (i32, Vec<PyGridTrackSize>) = ob.extract()?;
+        Ok(PyGridTrackSizing { repetition, tracks })
+    }
 }
 
 impl From<PyGridTrackSizing> for TrackSizingFunction {
     fn from(value: PyGridTrackSizing) -> TrackSizingFunction {
         if value.repetition == -2 {
-            TrackSizingFunction::Single(NonRepeatedTrackSizingFunction::from(value.single.unwrap()))
+            TrackSizingFunction::Single(NonRepeatedTrackSizingFunction::from(
+                value.tracks.into_iter().next().unwrap(),
+            ))
         } else {
             TrackSizingFunction::Repeat(
                 GridTrackRepetition::from_index(value.repetition),
                 value
-                    .repeat
+                    .tracks
                     .into_iter()
                     .map(|e| NonRepeatedTrackSizingFunction::from(e))
                     .collect(),
@@ -426,7 +486,6 @@ impl From<PyLength> for MaxTrackSizingFunction {
     }
 }
 
-#[derive(FromPyObject, IntoPyObject)]
 pub struct PyStyle {
     // Layout mode/strategy
     display: i32,
@@ -474,6 +533,175 @@ pub struct PyStyle {
     justify_content: Option<i32>,
 }
 
+// The fixed-size style properties are passed from Python packed into a single
+// buffer of little-endian 4-byte ints/floats (see `_STYLE_STRUCT` in
+// `style/core.py`), in the order they are read below. Optional ints are encoded
+// as -1 and optional floats as NaN. Grid track sizing is passed separately.
+const PACKED_STYLE_LEN: usize = 76 * 4;
+
+struct PackedStyleReader<'a> {
+    buf: &'a [u8],
+    pos: usize,
+}
+
+impl<'a> PackedStyleReader<'a> {
+    fn i32(&mut self) -> i32 {
+        let value = i32::from_le_bytes(self.buf[self.pos..self.pos + 4].try_into().unwrap());
+        self.pos += 4;
+        value
+    }
+
+    fn f32(&mut self) -> f32 {
+        let value = f32::from_le_bytes(self.buf[self.pos..self.pos + 4].try_into().unwrap());
+        self.pos += 4;
+        value
+    }
+
+    fn optional_i32(&mut self) -> Option<i32> {
+        let value = self.i32();
+        if value < 0 { None } else { Some(value) }
+    }
+
+    fn optional_f32(&mut self) -> Option<f32> {
+        let value = self.f32();
+        if value.is_nan() { None } else { Some(value) }
+    }
+
+    fn length(&mut self) -> PyLength {
+        let dim = self.i32();
+        let value = self.f32();
+        PyLength { dim, value }
+    }
+
+    fn size(&mut self) -> PySize {
+        let width = self.length();
+        let height = self.length();
+        PySize { width, height }
+    }
+
+    fn rect(&mut self) -> PyRect {
+        let top = self.length();
+        let right = self.length();
+        let bottom = self.length();
+        let left = self.length();
+        PyRect { left, right, top, bottom }
+    }
+
+    fn grid_index(&mut self) -> PyResult<PyGridIndex> {
+        let kind = self.i32();
+        let kind = i8::try_from(kind).map_err(|_| {
+            PyValueError::new_err(format!("grid index kind {} is out of range", kind))
+        })?;
+        let value = self.i32();
+        let value = i16::try_from(value).map_err(|_| {
+            PyValueError::new_err(format!("grid index value {} is out of range", value))
+        })?;
+        Ok(PyGridIndex { kind, value })
+    }
+
+    fn grid_placement(&mut self) -> PyResult<PyGridPlacement> {
+        let start = self.grid_index()?;
+        let end = self.grid_index()?;
+        Ok(PyGridPlacement { start, end })
+    }
+}
+
+impl PyStyle {
+    // Reads the fixed-size properties from the packed buffer. Grid track sizing
+    // is not part of the buffer and is left empty.
+    fn from_packed(buf: &[u8]) -> PyResult<Self> {
+        if buf.len() != PACKED_STYLE_LEN {
+            return Err(PyValueError::new_err(format!(
+                "packed style must be {} bytes, not {}",
+                PACKED_STYLE_LEN,
+                buf.len()
+            )));
+        }
+        let mut r = PackedStyleReader { buf, pos: 0 };
+        // Enums first (in the order of `_STYLE_ENUM_FIELDS`)
+        let display = r.i32();
+        let box_sizing = r.i32();
+        let overflow_x = r.i32();
+        let overflow_y = r.i32();
+        let position = r.i32();
+        let align_items = r.optional_i32();
+        let justify_items = r.optional_i32();
+        let align_self = r.optional_i32();
+        let justify_self = r.optional_i32();
+        let align_content = r.optional_i32();
+        let justify_content = r.optional_i32();
+        let flex_wrap = r.i32();
+        let flex_direction = r.i32();
+        let grid_auto_flow = r.i32();
+        let style = PyStyle {
+            // Layout mode/strategy
+            display,
+            box_sizing,
+            // Overflow
+            overflow_x,
+            overflow_y,
+            scrollbar_width: r.f32(),
+            // Position
+            position,
+            inset: r.rect(),
+            // Alignment
+            gap: r.size(),
+            // Spacing
+            margin: r.rect(),
+            border: r.rect(),
+            padding: r.rect(),
+            // Size
+            size: r.size(),
+            min_size: r.size(),
+            max_size: r.size(),
+            // Flex
+            flex_wrap,
+            flex_direction,
+            flex_grow: r.f32(),
+            flex_shrink: r.f32(),
+            flex_basis: r.length(),
+            // Size, optional
+            aspect_ratio: r.optional_f32(),
+            // Grid child properties
+            grid_row: r.grid_placement()?,
+            grid_column: r.grid_placement()?,
+            // Grid container properties
+            grid_auto_flow,
+            grid_template_rows: Vec::new(),
+            grid_template_columns: Vec::new(),
+            grid_auto_rows: Vec::new(),
+            grid_auto_columns: Vec::new(),
+            // Alignment, optional
+            align_items,
+            justify_items,
+            align_self,
+            justify_self,
+            align_content,
+            justify_content,
+        };
+        // Guard against the field order drifting from `_STYLE_STRUCT`
+        if r.pos != PACKED_STYLE_LEN {
+            return Err(PyValueError::new_err(format!(
+                "packed style has {} unread bytes",
+                PACKED_STYLE_LEN - r.pos
+            )));
+        }
+        Ok(style)
+    }
+}
+
+impl<'py> pyo3::FromPyObject<'py> for PyStyle {
+    fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
+        let packed = ob.get_item("packed")?;
+        let mut style = PyStyle::from_packed(packed.downcast::<PyBytes>()?.as_bytes())?;
+        style.grid_template_rows = ob.get_item("grid_template_rows")?.extract()?;
+        style.grid_template_columns = ob.get_item("grid_template_columns")?.extract()?;
+        style.grid_auto_rows = ob.get_item("grid_auto_rows")?.extract()?;
+        style.grid_auto_columns = ob.get_item("grid_auto_columns")?.extract()?;
+        Ok(style)
+    }
+}
+
 impl From<PyStyle> for Style {
     fn from(raw: PyStyle) -> Style {
         Style {
@@ -567,6 +795,20 @@ unsafe fn node_add_child(taffy_ptr: usize, node_id: u64, child_node_id: u64) {
     Box::leak(taffy);
 }
 
+#[pyfunction]
+unsafe fn node_add_children(taffy_ptr: usize, node_id: u64, child_node_ids: Vec<u64>) {
+    // Add several existing nodes as children to another existing node, in order
+
+    let mut taffy = Box::from_raw(taffy_ptr as *mut TaffyTree);
+
+    let node = NodeId::from(node_id);
+    for child_node_id in child_node_ids {
+        taffy.add_child(node, NodeId::from(child_node_id)).unwrap();
+    }
+
+    Box::leak(taffy);
+}
+
 #[pyfunction]
 fn node_drop(taffy_ptr: usize, node_id: u64) {
     // Remove a specific node from the tree and drop it
@@ -848,6 +1090,7 @@ fn taffylib(py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_wrapped(wrap_pyfunction!(node_drop))?;
     m.add_wrapped(wrap_pyfunction!(node_drop_all))?;
     m.add_wrapped(wrap_pyfunction!(node_add_child))?;
+    m.add_wrapped(wrap_pyfunction!(node_add_children))?;
     m.add_wrapped(wrap_pyfunction!(node_replace_child_at_index))?;
     m.add_wrapped(wrap_pyfunction!(node_remove_child))?;
     m.add_wrapped(wrap_pyfunction!(node_remove_child_at_index))?;
@@ -861,3 +1104,120 @@ fn taffylib(py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    // Expands the format of `_STYLE_STRUCT` in `style/core.py` (a sum of string
+    // literals, optionally repeated, eg. `"<14if" + "if" * 24`) into one type
+    // code per 4-byte word.
+    fn style_struct_codes() -> Vec<char> {
+        let source = include_str!("stretchable/style/core.py");
+        let expr = source
+            .lines()
+            .find_map(|line| line.strip_prefix("_STYLE_STRUCT = struct.Struct("))
+            .and_then(|rest| rest.strip_suffix(')'))
+            .expect("_STYLE_STRUCT not found in style/core.py");
+        let mut codes = Vec::new();
+        for term in expr.split('+') {
+            let (literal, repeat) = match term.split_once('*') {
+                Some((literal, n)) => (literal, n.trim().parse::<usize>().unwrap()),
+                None => (term, 1),
+            };
+            let literal = literal.trim().trim_matches('"').trim_start_matches('<');
+            let mut term_codes = Vec::new();
+            let mut count = String::new();
+            for c in literal.chars() {
+                if c.is_ascii_digit() {
+                    count.push(c);
+                    continue;
+                }
+                let n = if count.is_empty() { 1 } else { count.parse().unwrap() };
+                term_codes.extend(std::iter::repeat(c).take(n));
+                count.clear();
+            }
+            for _ in 0..repeat {
+                codes.extend(&term_codes);
+            }
+        }
+        codes
+    }
+
+    fn assert_length(length: &PyLength, word: i32) {
+        assert_eq!((length.dim, length.value), (word, (word + 1) as f32));
+    }
+
+    fn assert_size(size: &PySize, word: i32) {
+        assert_length(&size.width, word);
+        assert_length(&size.height, word + 2);
+    }
+
+    fn assert_rect(rect: &PyRect, word: i32) {
+        assert_length(&rect.top, word);
+        assert_length(&rect.right, word + 2);
+        assert_length(&rect.bottom, word + 4);
+        assert_length(&rect.left, word + 6);
+    }
+
+    fn assert_grid_placement(placement: &PyGridPlacement, word: i32) {
+        assert_eq!((placement.start.kind, placement.start.value), (word as i8, word as i16 + 1));
+        assert_eq!((placement.end.kind, placement.end.value), (word as i8 + 2, word as i16 + 3));
+    }
+
+    #[test]
+    fn packed_style_matches_style_struct() {
+        let codes = style_struct_codes();
+        assert_eq!(codes.len() * 4, PACKED_STYLE_LEN);
+
+        // Store the index of each word in the word itself (as the type given by
+        // `_STYLE_STRUCT`), so every field shows where it was read from
+        let mut buf = Vec::with_capacity(PACKED_STYLE_LEN);
+        for (word, code) in codes.iter().enumerate() {
+            match code {
+                'i' => buf.extend((word as i32).to_le_bytes()),
+                'f' => buf.extend((word as f32).to_le_bytes()),
+                _ => panic!("unsupported type code {}", code),
+            }
+        }
+        let style = PyStyle::from_packed(&buf).unwrap();
+
+        let enums = [
+            style.display,
+            style.box_sizing,
+            style.overflow_x,
+            style.overflow_y,
+            style.position,
+        ];
+        assert_eq!(enums, [0, 1, 2, 3, 4]);
+        let optional_enums = [
+            style.align_items,
+            style.justify_items,
+            style.align_self,
+            style.justify_self,
+            style.align_content,
+            style.justify_content,
+        ];
+        assert_eq!(optional_enums, [5, 6, 7, 8, 9, 10].map(Some));
+        assert_eq!([style.flex_wrap, style.flex_direction, style.grid_auto_flow], [11, 12, 13]);
+        assert_eq!(style.scrollbar_width, 14.0);
+        assert_rect(&style.inset, 15);
+        assert_size(&style.gap, 23);
+        assert_rect(&style.margin, 27);
+        assert_rect(&style.border, 35);
+        assert_rect(&style.padding, 43);
+        assert_size(&style.size, 51);
+        assert_size(&style.min_size, 55);
+        assert_size(&style.max_size, 59);
+        assert_eq!((style.flex_grow, style.flex_shrink), (63.0, 64.0));
+        assert_length(&style.flex_basis, 65);
+        assert_eq!(style.aspect_ratio, Some(67.0));
+        assert_grid_placement(&style.grid_row, 68);
+        assert_grid_placement(&style.grid_column, 72);
+    }
+
+    #[test]
+    fn packed_style_rejects_wrong_length() {
+        assert!(PyStyle::from_packed(&[0; PACKED_STYLE_LEN - 4]).is_err());
+    }
+}
@@ -1,4 +1,5 @@
 import logging
+import weakref
 
 from . import taffylib
 
@@ -8,20 +9,25 @@ logger = logging.getLogger(__name__)
 
 class Taffy:
     def __init__(self) -> None:
-        self.__ptr = taffylib.init()
-        logger.debug("init() -> %s", self.__ptr)
+        # The native taffy tree is created on first use of `_ptr` (see below)
+        self.__ptr = None
+        self._finalizer: weakref.finalize = None
         self._use_rounding: bool = True
 
-    def __del__(self) -> None:
-        if self.__ptr is None:
-            return
-        taffylib.free(self.__ptr)
-        logger.debug("free(ptr: %s)", self.__ptr)
-        self.__ptr = None
+    @staticmethod
+    def _free(ptr: int) -> None:
+        taffylib.free(ptr)
+        logger.debug("free(ptr: %s)", ptr)
 
     @property
     def _ptr(self) -> int:
-        return self.__ptr
+        if self._finalizer is None:
+            self.__ptr = taffylib.init()
+            logger.debug("init() -> %s", self.__ptr)
+            # Free the taffy tree when this instance is garbage collected, or at
+            # interpreter exit at the latest
+            self._finalizer = weakref.finalize(self, Taffy._free, self.__ptr)
+        return self.__ptr if self._finalizer.alive else None
 
     @property
     def use_rounding(self) -> bool:
@@ -26,6 +26,9 @@ logger = logging.getLogger(__name__)
 
 _valid_key = re.compile(r"^[-_!:;()\]\[a-zA-Z0-9]*[a-zA-Z]+[-_!:;()\]\[a-zA-Z0-9]*$")
 
+# Style is immutable, so nodes created without any style share one instance
+_DEFAULT_STYLE = Style()
+
 MeasureFunc = Callable[["Node", SizePoints, SizeAvailableSpace], SizePoints]
 
 USE_ROOT_CONTAINER: bool = False
@@ -43,11 +46,10 @@ def _measure_callback(
 ) -> tuple[float, float]:
     """This function is a wrapper for the user-supplied measure function,
     converting arguments into and results from the call by Taffy."""
-    if not context or context < 0 or context not in nodes:
+    node = nodes.get(context) if context and context > 0 else None
+    if node is None:
         return (0, 0)
 
-    node = nodes[context]
-
     known_dimensions = SizePoints(width=known_width, height=known_height)
     available_space = SizeAvailableSpace(
         LengthAvailableSpace.from_dict(available_width),
@@ -55,7 +57,8 @@ def _measure_callback(
     )
     result = node.measure(node, known_dimensions, available_space)
     assert isinstance(result, SizePoints)
-    logger.debug("node_measure_callback(node_id: %s) -> %s", context, result)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("node_measure_callback(node_id: %s) -> %s", context, result)
     return (
         result.width.value if result.width else NAN,
         result.height.value if result.height else NAN,
@@ -161,7 +164,6 @@ class Node(list):
     __slots__ = (
         "_key",
         "_style",
-        "_children",
         "_measure",
         "_box",
         "_container",
@@ -179,8 +181,8 @@ class Node(list):
         style: Style = None,
         **kwargs,
     ):
-        self.__node_id = None
-        if not taffy._ptr:
+        taffy_ptr = taffy._ptr
+        if not taffy_ptr:
             raise TaffyUnavailableError
 
         # Node key requirements:
@@ -197,21 +199,21 @@ class Node(list):
 
         # Style
         if not style:
-            style = Style(**kwargs)
+            style = Style(**kwargs) if kwargs else _DEFAULT_STYLE
         elif kwargs:
             raise ValueError("Provide only `style` or style attributes, not both")
         self._style = style
 
         # Create node in taffy
-        self.__node_id = taffylib.node_create(taffy._ptr, self._style.to_dict())
-        logger.debug(
-            "node_create(taffy: %s) -> node_id: %s",
-            taffy._ptr,
-            self._node_id,
-        )
+        self.__node_id = taffylib.node_create(taffy_ptr, self._style.to_dict())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "node_create(taffy: %s) -> node_id: %s",
+                taffy_ptr,
+                self._node_id,
+            )
 
         # Children
-        self._children = []
         self.add(*children)
 
         if measure is None:
@@ -268,31 +270,58 @@ class Node(list):
         elif node.parent:
             raise Exception("Node is already associated with a parent node")
         taffylib.node_add_child(taffy._ptr, self._node_id, node._node_id)
-        logger.debug(
-            "node_add_child(taffy: %s, parent: %s, child: %s)",
-            taffy._ptr,
-            self._node_id,
-            node._node_id,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "node_add_child(taffy: %s, parent: %s, child: %s)",
+                taffy._ptr,
+                self._node_id,
+                node._node_id,
+            )
         node.parent = self
         super().append(node)
 
     def extend(self, __iterable: Iterable[Node]) -> None:
         """Add one or more child nodes."""
-        for child in __iterable:
-            self.append(child)
+        children = list(__iterable)
+        if len(children) < 2:
+            for child in children:
+                self.append(child)
+            return
+        if not taffy._ptr:
+            raise TaffyUnavailableError
+        for node in children:
+            if not isinstance(node, Node):
+                raise TypeError("Only nodes can be added")
+            elif node.parent:
+                raise Exception("Node is already associated with a parent node")
+        if len(set(map(id, children))) != len(children):
+            raise Exception("Node is already associated with a parent node")
+        # Attach all children to the taffy node in a single call
+        child_ids = [node._node_id for node in children]
+        taffylib.node_add_children(taffy._ptr, self._node_id, child_ids)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "node_add_children(taffy: %s, parent: %s, children: %s)",
+                taffy._ptr,
+                self._node_id,
+                child_ids,
+            )
+        for node in children:
+            node.parent = self
+        super().extend(children)
 
     def remove(self, node: Node) -> None:
         """Remove child `Node`."""
         if not taffy._ptr:
             raise TaffyUnavailableError
         taffylib.node_remove_child(taffy._ptr, self._node_id, node._node_id)
-        logger.debug(
-            "node_remove_child(taffy: %s, parent: %s, child: %s)",
-            taffy._ptr,
-            self._node_id,
-            node._node_id,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "node_remove_child(taffy: %s, parent: %s, child: %s)",
+                taffy._ptr,
+                self._node_id,
+                node._node_id,
+            )
         node.parent = None
         return super().remove(node)
 
@@ -305,12 +334,13 @@ class Node(list):
             else [__index]
         ):
             taffylib.node_remove_child_at_index(taffy._ptr, self._node_id, index)
-            logger.debug(
-                "node_remove_child_at_index(taffy: %s, parent: %s, index: %s)",
-                taffy._ptr,
-                self._node_id,
-                index,
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "node_remove_child_at_index(taffy: %s, parent: %s, index: %s)",
+                    taffy._ptr,
+                    self._node_id,
+                    index,
+                )
             self[index].parent = None
             super().__delitem__(index)
 
@@ -439,11 +469,12 @@ class Node(list):
 
         self._style = style
         taffylib.node_set_style(taffy._ptr, self._node_id, style.to_dict())
-        logger.debug(
-            "node_set_style(taffy: %s, node_id: %s)",
-            taffy._ptr,
-            self._node_id,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "node_set_style(taffy: %s, node_id: %s)",
+                taffy._ptr,
+                self._node_id,
+            )
 
     @property
     def is_dirty(self) -> bool:
@@ -505,7 +536,8 @@ class Node(list):
         )
         result = node.measure(known_dimensions, available_space)
         assert isinstance(result, SizePoints)
-        logger.debug("node_measure_callback() -> %s", result)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("node_measure_callback() -> %s", result)
         return (
             result.width.value if result.width else NAN,
             result.height.value if result.height else NAN,
@@ -526,19 +558,21 @@ class Node(list):
             taffylib.node_set_measure(taffy._ptr, self._node_id, False)
             if self._node_id in _node_refs:
                 del _node_refs[self._node_id]
-            logger.debug(
-                "node_set_measure(taffy: %s, node_id: %s, measure: False)",
-                taffy._ptr,
-                self._node_id,
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "node_set_measure(taffy: %s, node_id: %s, measure: False)",
+                    taffy._ptr,
+                    self._node_id,
+                )
         else:
             taffylib.node_set_measure(taffy._ptr, self._node_id, True)
             _node_refs[self._node_id] = self
-            logger.debug(
-                "node_set_measure(taffy: %s, node_id: %s, measure: True)",
-                taffy._ptr,
-                self._node_id,
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "node_set_measure(taffy: %s, node_id: %s, measure: True)",
+                    taffy._ptr,
+                    self._node_id,
+                )
 
     def compute_layout(
         self,
@@ -589,7 +623,7 @@ class Node(list):
         result = taffylib.node_compute_layout_with_measure(
             taffy._ptr,
             ptr,
-            available_space.to_dict(),
+            available_space.to_tuple(),
             lambda known_width, known_height, available_width, available_height, context: _measure_callback(
                 _node_refs,
                 known_width,
@@ -632,16 +666,17 @@ class Node(list):
         box = box._inset(layout["padding"])
         self._box[Edge.CONTENT] = box
 
-        logger.debug(
-            "node_get_layout(taffy: %s, node_id: %s) -> %s, margin: %s, border: %s, padding: %s, content: %s",
-            taffy._ptr,
-            self._node_id,
-            layout,
-            self._box[Edge.MARGIN],
-            self._box[Edge.BORDER],
-            self._box[Edge.PADDING],
-            self._box[Edge.CONTENT],
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "node_get_layout(taffy: %s, node_id: %s) -> %s, margin: %s, border: %s, padding: %s, content: %s",
+                taffy._ptr,
+                self._node_id,
+                layout,
+                self._box[Edge.MARGIN],
+                self._box[Edge.BORDER],
+                self._box[Edge.PADDING],
+                self._box[Edge.CONTENT],
+            )
 
         if self.is_visible:
             for child in self:
@@ -703,8 +738,10 @@ class Node(list):
         if self.is_dirty:
             raise LayoutNotComputedError
 
-        if relative and not flip_y and edge in self._box:
-            return self._box[edge]
+        if relative and not flip_y:
+            box = self._box.get(edge)
+            if box is not None:
+                return box
 
         # TODO: Consider implementing a caching mechanism for relative and/or flip_y
         # h = hash((edge, relative, flip_y))
@@ -782,12 +819,13 @@ class Container:
 
         # Create node in taffy
         self.__node_id = taffylib.node_create(taffy._ptr, self._style.to_dict())
-        logger.debug(
-            "node_create(taffy: %s, style: %s) -> %s",
-            taffy._ptr,
-            self._style._ptr,
-            self.__ptr,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "node_create(taffy: %s, style: %s) -> %s",
+                taffy._ptr,
+                self._style._ptr,
+                self.__ptr,
+            )
         # Add root node as child of this node
         taffylib.node_add_child(taffy._ptr, self._ptr, root._node_id)
 
@@ -797,15 +835,16 @@ class Container:
         layout = taffylib.node_get_layout(taffy._ptr, self._ptr)
         x, y = layout["location"]
         width, height = layout["size"]
-        logger.debug(
-            "node_get_layout(taffy: %s, node_id: %s [container]) -> (left: %s, top: %s, width: %s, height: %s)",
-            taffy._ptr,
-            self._ptr,
-            x,
-            y,
-            width,
-            height,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "node_get_layout(taffy: %s, node_id: %s [container]) -> (left: %s, top: %s, width: %s, height: %s)",
+                taffy._ptr,
+                self._ptr,
+                x,
+                y,
+                width,
+                height,
+            )
 
         # Expand box to contain the root node
         root_width = (
@@ -827,7 +866,8 @@ class Container:
         if root_height > height:
             height = root_height
         self._layout = Box(x, y, width, height)
-        logger.debug("container dimensions: %s x %s", root_width, root_height)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("container dimensions: %s x %s", root_width, root_height)
 
     @property
     def layout(self) -> Box:
@@ -2,14 +2,18 @@ from __future__ import annotations
 
 import logging
 import re
+import struct
 from enum import Enum, IntEnum
-from typing import Any, Iterable, Optional
+from functools import lru_cache
+from typing import Any, Optional
+from weakref import WeakValueDictionary
 
-from attrs import define, field, validators
+from attrs import astuple, define, field, fields
 
 from .geometry import length, rect
 from .geometry import size as _size
 from .props import (
+    _TRACK_SEPARATOR,
     AlignContent,
     AlignItems,
     AlignSelf,
@@ -33,6 +37,13 @@ from .props import (
 logging.basicConfig(format="%(levelname)s:%(name)s:%(message)s")
 logger = logging.getLogger(__name__)
 
+# Layout of the fixed-size part of the style passed to taffylib (see
+# `Style.to_dict()`): the enums in the order of `_STYLE_ENUM_FIELDS` (unset
+# optional enums as -1), followed by the floats and lengths (an unset aspect
+# ratio as NaN) and the grid row/column placements as (kind, value) for start
+# and end. This must match `PyStyle` in `lib.rs`.
+_STYLE_STRUCT = struct.Struct("<14if" + "if" * 24 + "2f" + "if" + "f" + "8i")
+
 _ATTR_NAMES: dict[str, tuple[str]] = {
     "gap": ("column-gap", "row-gap"),
     "size": (),
@@ -42,19 +53,184 @@ _ATTR_NAMES: dict[str, tuple[str]] = {
 }
 
 
-def grid_template_from_any(value: Any) -> list[GridTrackSizing]:
+def _rect_prop_names(
+    prefix: str = None, suffix: str = None
+) -> tuple[tuple[str, ...], tuple[tuple[str, ...], ...]]:
+    # Returns the inline property names of the shorthand (eg. `margin`,
+    # `margin-width`) and of each side in the order top, right, bottom, left
+    # (eg. `margin-right`, `margin-right-width`, `margin-end`, ...)
+    variants = ("", "-" + suffix) if suffix else ("",)
+    shorthand = tuple(prefix + v for v in variants) if prefix else ()
+    sides = tuple(
+        tuple(
+            (f"{prefix}-{key}" if prefix else key) + v for key in keys for v in variants
+        )
+        for keys in (("top",), ("right", "end"), ("bottom",), ("left", "start"))
+    )
+    return shorthand, sides
+
+
+# Inline property names are fixed, so they are built once here rather than on
+# every call to `Style.from_inline()`.
+_RECT_PROP_NAMES: dict[str, tuple[tuple[str, ...], tuple[tuple[str, ...], ...]]] = {
+    "inset": _rect_prop_names(),
+    "margin": _rect_prop_names("margin", "width"),
+    "border": _rect_prop_names("border", "width"),
+    "padding": _rect_prop_names("padding", "width"),
+}
+
+_SIZE_PROP_NAMES: dict[str, tuple[str, str]] = {
+    "size": ("width", "height"),
+    "min_size": ("min-width", "min-height"),
+    "max_size": ("max-width", "max-height"),
+}
+
+
+# Default values of the geometry fields of `Style`. These are immutable, so all
+# styles share the same instances (the field converters return instances
+# of the right type as-is) rather than converting the default on every init.
+_DEFAULT_INSET = rect.RectPointsPercentAuto(length.AUTO)
+_DEFAULT_GAP = _size.SizePointsPercent(0.0)
+_DEFAULT_SPACING = rect.RectPointsPercent(0.0)
+_DEFAULT_MARGIN = rect.RectPointsPercentAuto(0.0)
+_DEFAULT_SIZE = _size.SizePointsPercentAuto(length.AUTO)
+_DEFAULT_FLEX_BASIS = length.LengthPointsPercentAuto.auto()
+_DEFAULT_GRID_PLACEMENT = GridPlacement()
+
+# Enum-valued fields of `Style` as (name, type, optional), type checked in a
+# single pass in `Style.__attrs_post_init__()`
+_STYLE_ENUM_FIELDS: tuple[tuple[str, type, bool], ...] = (
+    ("display", Display, False),
+    ("box_sizing", BoxSizing, False),
+    ("overflow_x", Overflow, False),
+    ("overflow_y", Overflow, False),
+    ("position", Position, False),
+    ("align_items", AlignItems, True),
+    ("justify_items", JustifyItems, True),
+    ("align_self", AlignSelf, True),
+    ("justify_self", JustifySelf, True),
+    ("align_content", AlignContent, True),
+    ("justify_content", JustifyContent, True),
+    ("flex_wrap", FlexWrap, False),
+    ("flex_direction", FlexDirection, False),
+    ("grid_auto_flow", GridAutoFlow, False),
+)
+
+# Enum type of each enum-valued inline style property
+_INLINE_ENUMS: dict[str, type[IntEnum]] = {
+    "display": Display,
+    "box-sizing": BoxSizing,
+    "overflow": Overflow,
+    "justify-content": JustifyContent,
+    "justify-items": JustifyItems,
+    "justify-self": JustifySelf,
+    "align-items": AlignItems,
+    "align-self": AlignSelf,
+    "align-content": AlignContent,
+    "flex-direction": FlexDirection,
+    "position": Position,
+    "flex-wrap": FlexWrap,
+    "grid-auto-flow": GridAutoFlow,
+}
+
+# Members of each inline enum property by their CSS keyword (eg. "row-reverse"),
+# which is how values come out of `parse_value()`
+_INLINE_ENUM_VALUES: dict[str, dict[str, IntEnum]] = {
+    prop: {m._name_.lower().replace("_", "-"): m for m in enum}
+    for prop, enum in _INLINE_ENUMS.items()
+}
+
+# Enum and float inline style properties, handled one name at a time
+_INLINE_ENUM_PROPS: tuple[str, ...] = (
+    "display",
+    "box-sizing",
+    "flex-direction",
+    "flex-wrap",
+    "align-items",
+    "align-self",
+    "align-content",
+    "justify-items",
+    "justify-self",
+    "justify-content",
+    "position",
+    "grid-auto-flow",
+)
+_INLINE_FLOAT_PROPS: tuple[str, ...] = (
+    "flex-basis",
+    "flex-grow",
+    "flex-shrink",
+    "aspect-ratio",
+    "scrollbar-width",
+)
+
+
+def _inline_prop_groups() -> dict[str, str]:
+    # Maps each supported inline property name to the group of properties that
+    # is handled together in `Style.from_inline()`, so that only the groups
+    # present in a style need to be looked up
+    groups = {name: name for name in _INLINE_ENUM_PROPS + _INLINE_FLOAT_PROPS}
+    for prop, names in _SIZE_PROP_NAMES.items():
+        groups.update(dict.fromkeys(names, prop))
+    for prop, (shorthand, sides) in _RECT_PROP_NAMES.items():
+        groups.update(dict.fromkeys(shorthand, prop))
+        for names in sides:
+            groups.update(dict.fromkeys(names, prop))
+    groups.update(dict.fromkeys(("gap", "row-gap", "column-gap"), "gap"))
+    groups.update(dict.fromkeys(("overflow", "overflow-x", "overflow-y"), "overflow"))
+    groups["flex"] = "flex"
+    for suffix in ("row", "column"):
+        groups[f"grid-template-{suffix}s"] = "grid"
+        groups[f"grid-auto-{suffix}s"] = "grid"
+        groups[f"grid-{suffix}"] = "grid"
+    return groups
+
+
+_INLINE_PROP_GROUPS = _inline_prop_groups()
+
+# A single declaration of an inline style, with the surrounding whitespace
+# stripped from name and value. The value group is None if there is no colon.
+_DECLARATION = re.compile(r"\s*([^:;]*?)\s*(?::\s*([^;]*?)\s*)?(?:;|$)")
+
+# Styles built by `Style.from_inline()` that are still in use, keyed by their
+# field values. Documents typically repeat a handful of distinct inline styles
+# across many elements, so equal styles share a single instance.
+_INTERNED: WeakValueDictionary[tuple, Style] = WeakValueDictionary()
+
+
+def _intern(style: Style) -> Style:
+    # The value types are part of the key, so eg. `flex_shrink=1` and
+    # `flex_shrink=1.0` (which compare equal) are not merged
+    values = astuple(style, recurse=False, filter=lambda attr, _: attr.init)
+    key = tuple((type(value), value) for value in values)
+    return _INTERNED.setdefault(key, style)
+
+
+def grid_template_from_any(value: Any) -> tuple[GridTrackSizing, ...]:
+    if value is None:
+        return _DEFAULT_GRID_TEMPLATE
+    if type(value) is tuple and all(type(v) is GridTrackSizing for v in value):
+        return value
     if not isinstance(value, (list, tuple)):
         value = [value]
-    return [GridTrackSizing.from_any(v) for v in value]
+    return tuple(GridTrackSizing.from_any(v) for v in value)
 
 
-def grid_auto_from_any(value: Any) -> list[GridTrackSize]:
+def grid_auto_from_any(value: Any) -> tuple[GridTrackSize, ...]:
+    if value is None:
+        return _DEFAULT_GRID_AUTO
+    if type(value) is tuple and all(type(v) is GridTrackSize for v in value):
+        return value
     if not isinstance(value, (list, tuple)):
         value = [value]
-    return [GridTrackSize.from_any(v) for v in value]
+    return tuple(GridTrackSize.from_any(v) for v in value)
 
 
-@define(frozen=True, kw_only=True)
+# Default grid track lists, shared by all styles (as the geometry defaults above)
+_DEFAULT_GRID_TEMPLATE = (GridTrackSizing.single(None),)
+_DEFAULT_GRID_AUTO = (GridTrackSize.auto(),)
+
+
+@define(frozen=True, kw_only=True, cache_hash=True)
 class Style:
     """Style configuration for a node.
 
@@ -83,187 +259,166 @@ class Style:
     """
 
     # Layout mode/strategy
-    display: Display = field(
-        default=Display.FLEX,
-        validator=[validators.instance_of(Display)],
-    )
+    display: Display = Display.FLEX
 
     # Sizing styles application
-    box_sizing: BoxSizing = field(
-        default=BoxSizing.BORDER,
-        validator=[validators.instance_of(BoxSizing)],
-    )
+    box_sizing: BoxSizing = BoxSizing.BORDER
 
     # Overflow
-    overflow_x: Overflow = field(
-        default=Overflow.VISIBLE,
-        validator=[validators.instance_of(Overflow)],
-    )
-    overflow_y: Overflow = field(
-        default=Overflow.VISIBLE,
-        validator=[validators.instance_of(Overflow)],
-    )
+    overflow_x: Overflow = Overflow.VISIBLE
+    overflow_y: Overflow = Overflow.VISIBLE
     scrollbar_width: float = 0.0
 
     # Position
-    position: Position = field(
-        default=Position.RELATIVE,
-        validator=[validators.instance_of(Position)],
-    )
+    position: Position = Position.RELATIVE
     inset: rect.RectPointsPercentAuto = field(
-        default=length.AUTO, converter=rect.RectPointsPercentAuto.from_any
+        default=_DEFAULT_INSET, converter=rect.RectPointsPercentAuto.from_any
     )
 
     # Alignment
-    align_items: AlignItems = field(
-        default=None,
-        validator=[validators.optional(validators.instance_of(AlignItems))],
-    )
-    justify_items: JustifyItems = field(
-        default=None,
-        validator=[validators.optional(validators.instance_of(JustifyItems))],
-    )
-    align_self: AlignSelf = field(
-        default=None,
-        validator=[validators.optional(validators.instance_of(AlignSelf))],
-    )
-    justify_self: JustifySelf = field(
-        default=None,
-        validator=[validators.optional(validators.instance_of(JustifySelf))],
-    )
-    align_content: AlignContent = field(
-        default=None,
-        validator=[validators.optional(validators.instance_of(AlignContent))],
-    )
-    justify_content: JustifyContent = field(
-        default=None,
-        validator=[validators.optional(validators.instance_of(JustifyContent))],
-    )
+    align_items: AlignItems = None
+    justify_items: JustifyItems = None
+    align_self: AlignSelf = None
+    justify_self: JustifySelf = None
+    align_content: AlignContent = None
+    justify_content: JustifyContent = None
     gap: _size.SizePointsPercent = field(
-        default=0.0, converter=_size.SizePointsPercent.from_any
+        default=_DEFAULT_GAP, converter=_size.SizePointsPercent.from_any
     )
 
     # Spacing
     padding: rect.RectPointsPercent = field(
-        default=0.0, converter=rect.RectPointsPercent.from_any
+        default=_DEFAULT_SPACING, converter=rect.RectPointsPercent.from_any
     )
     border: rect.RectPointsPercent = field(
-        default=0.0, converter=rect.RectPointsPercent.from_any
+        default=_DEFAULT_SPACING, converter=rect.RectPointsPercent.from_any
     )
     margin: rect.RectPointsPercentAuto = field(
-        default=0.0, converter=rect.RectPointsPercentAuto.from_any
+        default=_DEFAULT_MARGIN, converter=rect.RectPointsPercentAuto.from_any
     )
 
     # Size
     size: _size.SizePointsPercentAuto = field(
-        default=length.AUTO, converter=_size.SizePointsPercentAuto.from_any
+        default=_DEFAULT_SIZE, converter=_size.SizePointsPercentAuto.from_any
     )
     min_size: _size.SizePointsPercentAuto = field(
-        default=length.AUTO, converter=_size.SizePointsPercentAuto.from_any
+        default=_DEFAULT_SIZE, converter=_size.SizePointsPercentAuto.from_any
     )
     max_size: _size.SizePointsPercentAuto = field(
-        default=length.AUTO, converter=_size.SizePointsPercentAuto.from_any
+        default=_DEFAULT_SIZE, converter=_size.SizePointsPercentAuto.from_any
     )
     aspect_ratio: float = field(default=None)
 
     # Flex
-    flex_wrap: FlexWrap = field(
-        default=FlexWrap.NO_WRAP,
-        validator=[validators.instance_of(FlexWrap)],
-    )
-    flex_direction: FlexDirection = field(
-        default=FlexDirection.ROW,
-        validator=[validators.instance_of(FlexDirection)],
-    )
+    flex_wrap: FlexWrap = FlexWrap.NO_WRAP
+    flex_direction: FlexDirection = FlexDirection.ROW
     flex_grow: float = 0.0
     flex_shrink: float = 1.0
     flex_basis: length.LengthPointsPercentAuto = field(
-        default=length.AUTO, converter=length.LengthPointsPercentAuto.from_any
+        default=_DEFAULT_FLEX_BASIS, converter=length.LengthPointsPercentAuto.from_any
     )
 
     # Grid container
-    grid_auto_flow: GridAutoFlow = field(
-        default=GridAutoFlow.ROW,
-        validator=[validators.instance_of(GridAutoFlow)],
-    )
-    grid_template_rows: list[GridTrackSizing] = field(
+    grid_auto_flow: GridAutoFlow = GridAutoFlow.ROW
+    grid_template_rows: tuple[GridTrackSizing, ...] = field(
         default=None, converter=grid_template_from_any
     )
-    grid_template_columns: list[GridTrackSizing] = field(
+    grid_template_columns: tuple[GridTrackSizing, ...] = field(
         default=None, converter=grid_template_from_any
     )
-    grid_auto_rows: list[GridTrackSize] = field(
+    grid_auto_rows: tuple[GridTrackSize, ...] = field(
         default=None, converter=grid_auto_from_any
     )
-    grid_auto_columns: list[GridTrackSize] = field(
+    grid_auto_columns: tuple[GridTrackSize, ...] = field(
         default=None, converter=grid_auto_from_any
     )
 
     # Grid child
     grid_row: GridPlacement = field(
-        factory=GridPlacement, converter=GridPlacement.from_any
+        default=_DEFAULT_GRID_PLACEMENT, converter=GridPlacement.from_any
     )
     grid_column: GridPlacement = field(
-        factory=GridPlacement, converter=GridPlacement.from_any
+        default=_DEFAULT_GRID_PLACEMENT, converter=GridPlacement.from_any
     )
 
     # __ptr: int = field(init=False, default=None)
 
+    # Enum fields as plain ints, in the order packed by `to_dict()`
+    _enum_values: tuple[int, ...] = field(
+        init=False, default=None, repr=False, eq=False
+    )
+    # The result of `to_dict()`, built on first use
+    _dict: dict[str, Any] = field(init=False, default=None, repr=False, eq=False)
+
+    def __attrs_post_init__(self) -> None:
+        values = []
+        for name, _type, optional in _STYLE_ENUM_FIELDS:
+            value = getattr(self, name)
+            if isinstance(value, _type):
+                values.append(int(value))
+            elif optional and value is None:
+                values.append(-1)
+            else:
+                raise TypeError(
+                    f"'{name}' must be {_type!r} (got {value!r} that is a {value.__class__!r})."
+                )
+        object.__setattr__(self, "_enum_values", tuple(values))
+
     def to_dict(self) -> dict[str, Any]:
-        return dict(
-            # Layout/sizing mode
-            display=self.display,
-            box_sizing=self.box_sizing,
+        # Styles are immutable, so the result only needs to be built once even
+        # though it is passed to taffylib whenever the style is applied. All
+        # values are immutable, and the (shared) dict must not be modified.
+        d = self._dict
+        if d is None:
+            d = dict(
+                # All fixed-size properties, packed into a single buffer
+                packed=self._pack(),
+                # Grid container
+                grid_template_rows=tuple(e.to_tuple() for e in self.grid_template_rows),
+                grid_template_columns=tuple(
+                    e.to_tuple() for e in self.grid_template_columns
+                ),
+                grid_auto_rows=tuple(e.to_tuple() for e in self.grid_auto_rows),
+                grid_auto_columns=tuple(e.to_tuple() for e in self.grid_auto_columns),
+            )
+            object.__setattr__(self, "_dict", d)
+        return d
+
+    def _pack(self) -> bytes:
+        return _STYLE_STRUCT.pack(
+            *self._enum_values,
             # Overflow
-            overflow_x=self.overflow_x,
-            overflow_y=self.overflow_y,
-            scrollbar_width=self.scrollbar_width,
+            self.scrollbar_width,
             # Position
-            position=self.position,
-            inset=self.inset.to_dict(),
+            *self.inset.to_tuple(),
             # Alignment
-            gap=self.gap.to_dict(),
+            *self.gap.to_tuple(),
             # Spacing
-            margin=self.margin.to_dict(),
-            border=self.border.to_dict(),
-            padding=self.padding.to_dict(),
+            *self.margin.to_tuple(),
+            *self.border.to_tuple(),
+            *self.padding.to_tuple(),
             # Size
-            size=self.size.to_dict(),
-            min_size=self.min_size.to_dict(),
-            max_size=self.max_size.to_dict(),
+            *self.size.to_tuple(),
+            *self.min_size.to_tuple(),
+            *self.max_size.to_tuple(),
             # Flex
-            flex_wrap=self.flex_wrap,
-            flex_direction=self.flex_direction,
-            flex_grow=self.flex_grow,
-            flex_shrink=self.flex_shrink,
-            flex_basis=self.flex_basis.to_dict(),
-            # Grid container
-            grid_template_rows=[e.to_dict() for e in self.grid_template_rows],
-            grid_template_columns=[e.to_dict() for e in self.grid_template_columns],
-            grid_auto_rows=[e.to_dict() for e in self.grid_auto_rows],
-            grid_auto_columns=[e.to_dict() for e in self.grid_auto_columns],
-            grid_auto_flow=self.grid_auto_flow,
-            # Grid child
-            grid_row=self.grid_row.to_dict(),
-            grid_column=self.grid_column.to_dict(),
+            self.flex_grow,
+            self.flex_shrink,
+            *self.flex_basis.to_tuple(),
             # Size, optional
-            aspect_ratio=self.aspect_ratio,
-            # Alignment, optional
-            align_items=self.align_items,
-            justify_items=self.justify_items,
-            align_self=self.align_self,
-            justify_self=self.justify_self,
-            align_content=self.align_content,
-            justify_content=self.justify_content,
+            length.NAN if self.aspect_ratio is None else self.aspect_ratio,
+            # Grid child
+            *self.grid_row.to_tuple(),
+            *self.grid_column.to_tuple(),
         )
 
     def _str(self, args: Optional[tuple[str]] = None) -> str:
         entries = []
-        for arg in dir(self):
-            if arg.startswith("_"):
-                continue
-            if args and arg not in args:
-                continue
+        names = _STYLE_FIELD_NAMES
+        if args:
+            args = frozenset(args)
+            names = [name for name in names if name in args]
+        for arg in names:
             value = getattr(self, arg)
             if arg in _ATTR_NAMES:
                 entries.append(value._str(*_ATTR_NAMES[arg], include_class=False))
@@ -282,74 +437,68 @@ class Style:
 
     @staticmethod
     def from_inline(style: str) -> Style:
+        s, names, messages = Style._parse_inline(style)
+        # Parsing is cached, so the warnings are logged here on every call
+        for message in messages:
+            logger.warning(message)
+        if logger.isEnabledFor(logging.DEBUG):
+            # `_str()` formats every parsed property, so only build the message
+            # when it will actually be emitted (`from_inline()` runs once per
+            # element in `Node.from_xml()`).
+            logger.debug("from_inline('%s') => %s", style, s._str(names))
+        return s
+
+    # Styles are immutable, so the same inline style string (typically repeated
+    # across many elements of a document) is only parsed once
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_inline(style: str) -> tuple[Style, tuple[str, ...], tuple[str, ...]]:
+        """Returns the style, the names of the parsed properties and the warnings
+        for properties that could not be parsed or are not supported."""
+
+        messages = []
+
         def parse_style(style: str) -> dict[str, length.Length | str]:
             props = dict()
-            for entry in style.split(";"):
-                entry = entry.strip()
-                if not entry:
+            for match in _DECLARATION.finditer(style):
+                name, value = match.groups()
+                if value is None:
+                    if name:
+                        messages.append(f"Style declaration {name} could not be parsed")
                     continue
-                name, _, value = entry.partition(":")
                 if not name.startswith("grid-"):
                     value = parse_value(value)
-                props[name.strip()] = value
+                props[name] = value
             return props
 
-        def get_prop_name(prefix: str, key: str, suffix: str = None) -> str:
-            if prefix:
-                name = f"{prefix}-{key}" if key else prefix
-            elif not key:
-                raise ValueError("Either prefix or key must be specified")
-            else:
-                name = key
-            if suffix:
-                name += "-" + suffix
-            return name
-
-        def to_rect(
-            prefix: str = None,
-            *,
-            default: length.Length = length.NAN,
-            suffix: Iterable[str] = None,
-            start: Iterable[str] = ("left", "start"),
-            end: Iterable[str] = ("right", "end"),
-            top: Iterable[str] = ("top",),
-            bottom: Iterable[str] = ("bottom",),
-        ) -> rect.Rect:
-            if prefix:
-                for s in (None, suffix) if suffix else (None,):
-                    prop = get_prop_name(prefix, None, s)
-                    if prop in keys:
-                        keys.remove(prop)
-                        values = props[prop]
-                        try:
-                            return rect.Rect(*values)
-                        except TypeError:
-                            return rect.Rect(values)
+        def to_rect(prop: str, default: length.Length) -> rect.Rect:
+            shorthand, sides = _RECT_PROP_NAMES[prop]
+            for name in shorthand:
+                values = props.pop(name, None)
+                if values is not None:
+                    if isinstance(values, tuple):
+                        return rect.Rect(*values)
+                    return rect.Rect(values)
 
             values = [default] * 4
             not_present = True
-            for i, _keys in enumerate((top, end, bottom, start)):
-                for key in _keys:
-                    for s in (None, suffix) if suffix else (None,):
-                        prop = get_prop_name(prefix, key, s)
-                        if prop in keys:
-                            values[i] = props[prop]
-                            keys.remove(prop)
-                            not_present = False
+            for i, names in enumerate(sides):
+                for name in names:
+                    value = props.pop(name, None)
+                    if value is not None:
+                        values[i] = value
+                        not_present = False
             if not_present:
                 return None
             return rect.Rect(*values)
 
-        def to_size(
-            prefix: str = None, *, default: length.Length = length.AUTO
-        ) -> _size.Size:
+        def to_size(prop: str, *, default: length.Length = length.AUTO) -> _size.Size:
             values = [default] * 2
             not_present = True
-            for i, key in enumerate(("width", "height")):
-                prop = get_prop_name(prefix, key)
-                if prop in keys:
-                    values[i] = props[prop]
-                    keys.remove(prop)
+            for i, name in enumerate(_SIZE_PROP_NAMES[prop]):
+                value = props.pop(name, None)
+                if value is not None:
+                    values[i] = value
                     not_present = False
             if not_present:
                 return None
@@ -359,10 +508,9 @@ class Style:
             width, height = None, None
             for prefix in (None, "row", "column"):
                 prop = prefix + "-gap" if prefix else "gap"
-                if prop not in keys:
+                value = props.pop(prop, None)
+                if value is None:
                     continue
-                value = props[prop]
-                keys.remove(prop)
                 if isinstance(value, tuple) and len(value) == 2:
                     width, height = value
                 else:
@@ -377,59 +525,32 @@ class Style:
                 height=height if height is not None else 0,
             )
 
-        def prop_to_enum(prop: str) -> IntEnum:
-            if prop == "display":
-                return Display
-            elif prop == "box-sizing":
-                return BoxSizing
-            elif prop == "overflow":
-                return Overflow
-            elif prop == "justify-content":
-                return JustifyContent
-            elif prop == "justify-items":
-                return JustifyItems
-            elif prop == "justify-self":
-                return JustifySelf
-            elif prop == "align-items":
-                return AlignItems
-            elif prop == "align-self":
-                return AlignSelf
-            elif prop == "align-content":
-                return AlignContent
-            elif prop == "flex-direction":
-                return FlexDirection
-            elif prop == "position":
-                return Position
-            elif prop == "flex-wrap":
-                return FlexWrap
-            elif prop == "grid-auto-flow":
-                return GridAutoFlow
-            raise ValueError(f"Unrecognized property '{prop}'")
-
         def to_enum(prop: str) -> IntEnum:
-            if prop in keys:
-                keys.remove(prop)
-                enum = prop_to_enum(prop)
-                return enum[
-                    props[prop].strip().upper().replace("-", "_").replace(" ", "_")
+            value = props.pop(prop, None)
+            if value is None:
+                return None
+            member = _INLINE_ENUM_VALUES[prop].get(value)
+            if member is None:
+                # Fall back to normalizing the value into a member name
+                enum = _INLINE_ENUMS[prop]
+                member = enum[
+                    value.strip().upper().replace("-", "_").replace(" ", "_")
                 ]
+            return member
 
         def to_float(prop: str) -> float:
-            if prop in keys:
-                keys.remove(prop)
-                return props[prop]
+            return props.pop(prop, None)
 
         def to_flex() -> dict[str, length.Length | float]:
-            if "flex" not in keys:
+            v = props.pop("flex", None)
+            if v is None:
                 return None
 
-            v = props["flex"]
             if isinstance(v, str):
                 values = [parse_value(value) for value in v.split(" ")]
             else:
                 values = [v]
             n = len(values)
-            keys.remove("flex")
             return dict(
                 flex_grow=values[0],
                 flex_shrink=values[1] if n >= 2 else 1,
@@ -440,81 +561,81 @@ class Style:
             values = [None, None]
 
             # First look for 'overflow' which can be a single value (overflow-x == overflow_y) or two values
-            if "overflow" in keys:
-                value = props["overflow"].strip()
+            value = props.pop("overflow", None)
+            if value is not None:
+                value = value.strip()
                 values = value.split(" ")
                 n = len(values)
                 if n == 1:
                     values = values * 2
                 elif n > 2:
-                    logger.warning(
+                    messages.append(
                         f"Style property overflow: {value} could not be parsed"
                     )
-                keys.remove("overflow")
 
             # Then look for 'overflow-x' and 'overflow-y' (eg. these will override if overflow is also present)
             for i, prop in enumerate(("overflow-x", "overflow-y")):
-                if prop not in keys:
-                    continue
-                values[i] = props[prop]
-                keys.remove(prop)
+                value = props.pop(prop, None)
+                if value is not None:
+                    values[i] = value
 
             # Translate str values into corresponding enums and insert into dictionary
             r = dict()
             for prop, value in zip(("overflow_x", "overflow_y"), values):
                 if not value:
                     continue
-                r[prop] = Overflow[value.strip().upper()]
+                member = _INLINE_ENUM_VALUES["overflow"].get(value)
+                if member is None:
+                    member = Overflow[value.strip().upper()]
+                r[prop] = member
             return r
 
         def to_grid() -> dict[str, Any]:
             def split_parts(value: str) -> list[str]:
-                # Remove any spaces trailing the separator
-                value = value.strip().replace(", ", ",")
-                # Split into parts
-                return re.split(" (?![^(,]*\\))", value)
+                # Remove any spaces trailing the separator, then split into parts
+                return _TRACK_SEPARATOR.split(value.strip().replace(", ", ","))
 
             parsed = dict()
             for suffix in ("row", "column"):
                 # grid_template_rows/columns
                 prop = f"grid-template-{suffix}s"
-                if prop in keys:
+                if prop in props:
                     try:
                         value = props[prop]
                         parsed[prop.replace("-", "_")] = [
                             GridTrackSizing.from_inline(v) for v in split_parts(value)
                         ]
-                        keys.remove(prop)
+                        del props[prop]
                     except ValueError:
-                        logger.warning(
+                        messages.append(
                             f"Style property {prop}: {value} could not be parsed"
                         )
 
                 # grid-auto-rows/columns
                 prop = f"grid-auto-{suffix}s"
-                if prop in keys:
+                if prop in props:
                     try:
                         value = props[prop]
                         parsed[prop.replace("-", "_")] = [
                             GridTrackSize.from_inline(v) for v in split_parts(value)
                         ]
-                        keys.remove(prop)
+                        del props[prop]
                     except ValueError:
-                        logger.warning(
+                        messages.append(
                             f"Style property {prop}: {value} could not be parsed"
                         )
 
                 # grid-row/column
                 prop = f"grid-{suffix}"
-                if prop in keys:
+                if prop in props:
                     value = props[prop]
                     try:
                         parsed[prop.replace("-", "_")] = GridPlacement.from_inline(
                             props[prop]
                         )
-                        keys.remove(prop)
+                        del props[prop]
                     except ValueError:
-                        logger.warning(
+                        messages.append(
                             f"Style property {prop}: {value} could not be parsed"
                         )
 
@@ -551,83 +672,71 @@ class Style:
         """
 
         args = dict()
+        # Each helper below consumes (pops) the properties it handles
         props = parse_style(style)
-        keys = set(props.keys())
+
+        # Only run the helpers for the groups of properties that are present
+        present = {_INLINE_PROP_GROUPS.get(name) for name in props}
 
         # Size entries: size, max_size, min_size
-        for prefix in (None, "min", "max"):
-            v = to_size(prefix)
-            if v:
-                args[f"{prefix}_size" if prefix else "size"] = v
+        for prop in _SIZE_PROP_NAMES:
+            if prop in present:
+                v = to_size(prop)
+                if v:
+                    args[prop] = v
 
         # Row/column gap
-        v = to_gap()
-        if v:
-            args["gap"] = v
+        if "gap" in present:
+            v = to_gap()
+            if v:
+                args["gap"] = v
 
         # Rect entries: inset, margin, border, padding
-        for prop in ("inset", "margin", "border", "padding"):
-            prefix, suffix = (None, None) if prop == "inset" else (prop, "width")
-            v = to_rect(
-                prefix, suffix=suffix, default=length.AUTO if prop == "inset" else 0
-            )
-            if v:
-                args[prop] = v
+        for prop in _RECT_PROP_NAMES:
+            if prop in present:
+                v = to_rect(prop, default=length.AUTO if prop == "inset" else 0)
+                if v:
+                    args[prop] = v
 
         # Enum entries:
         #   display, flex-direction, flex-wrap, overflow,
         #   align-items, align-self, align-content, justify-content
         #   position (->position_type)
-        for prop in (
-            "display",
-            "box-sizing",
-            "flex-direction",
-            "flex-wrap",
-            "align-items",
-            "align-self",
-            "align-content",
-            "justify-items",
-            "justify-self",
-            "justify-content",
-            "position",
-            "grid-auto-flow",
-        ):
-            v = to_enum(prop)
-            if v is not None:
-                args[prop.replace("-", "_")] = v
+        for prop in _INLINE_ENUM_PROPS:
+            if prop in present:
+                v = to_enum(prop)
+                if v is not None:
+                    args[prop.replace("-", "_")] = v
 
         # float and Dim entries:
         #   flex-basis, flex-grow, flex-shrink, aspect-ratio
-        for prop in (
-            "flex-basis",
-            "flex-grow",
-            "flex-shrink",
-            "aspect-ratio",
-            "scrollbar-width",
-        ):
-            v = to_float(prop)
-            if v is not None:
-                args[prop.replace("-", "_")] = v
+        for prop in _INLINE_FLOAT_PROPS:
+            if prop in present:
+                v = to_float(prop)
+                if v is not None:
+                    args[prop.replace("-", "_")] = v
 
         # Special handling for flex property
-        v = to_flex()
-        if v:
-            args.update(**v)
+        if "flex" in present:
+            v = to_flex()
+            if v:
+                args.update(**v)
 
         # Special handling for overflow/overflow-x/overflow-y properties
-        v = to_overflow()
-        if v:
-            args.update(**v)
+        if "overflow" in present:
+            v = to_overflow()
+            if v:
+                args.update(**v)
 
         # Special handling for grid properties
-        v = to_grid()
-        if v:
-            args.update(**v)
+        if "grid" in present:
+            v = to_grid()
+            if v:
+                args.update(**v)
 
-        # If there are any keys left, these are unrecognized/unsupported
-        if len(keys) > 0:
-            for key in keys:
-                logger.warning(f"Style property {key} is not recognized/supported")
+        # If there are any properties left, these are unrecognized/unsupported
+        for key in props:
+            messages.append(f"Style property {key} is not recognized/supported")
 
         # values = []
         # for value in args.values():
@@ -646,6 +755,10 @@ class Style:
         #     *values,
         # )
 
-        s = Style(**args)
-        logger.debug("from_inline('%s') => %s", style, s._str(args.keys()))
-        return s
+        return _intern(Style(**args)), tuple(args), tuple(messages)
+
+
+# Public fields of `Style` in alphabetical order, as formatted by `Style._str()`
+_STYLE_FIELD_NAMES: tuple[str, ...] = tuple(
+    sorted(a.name for a in fields(Style) if not a.name.startswith("_"))
+)
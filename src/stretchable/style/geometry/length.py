@@ -66,18 +66,13 @@ class MaxTrackSize(IntEnum):
 # @define(frozen=True)
 class LengthBase(Generic[T]):
     _type_T: Any
-    __slots__ = ("scale", "value")
+    _scales: frozenset[int]
+    __slots__ = ("scale", "value", "_tuple")
 
-    @staticmethod
-    def _check_scale(T: type, scale: IntEnum) -> None:
-        if scale is None:
+    @classmethod
+    def _check_scale(cls, scale: IntEnum) -> None:
+        if scale is None or scale in cls._scales:
             return
-        for m in dir(T):
-            if m.startswith("_") or not m[0].isupper():
-                continue
-            v = getattr(T, m)
-            if v == scale:
-                return
 
         try:
             _scale = scale._name_
@@ -87,13 +82,29 @@ class LengthBase(Generic[T]):
 
     def __init_subclass__(cls) -> None:
         cls._type_T = get_args(cls.__orig_bases__[0])[0]
+        # Index the scales supported by T once, so checking a scale is a
+        # set lookup instead of a scan over the members of T.
+        cls._scales = frozenset(int(m) for m in cls._type_T)
 
     def __init__(self, scale: T = None, value: float = NAN) -> None:
         # Check if scale value corresponds to an allowed scale as defined by T.
         if scale:
-            LengthBase._check_scale(self._type_T, scale)
+            self._check_scale(scale)
         self.scale = scale
         self.value = value
+        # Lengths are immutable, so the wire representation passed to taffylib
+        # is built once here rather than on every call to `to_tuple()`.
+        self._tuple = None if scale is None else (int(scale), value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Lengths are shared (e.g. `AUTO` and the style defaults), so each
+        # value may only be assigned once, in `__init__`
+        if hasattr(self, name):
+            raise AttributeError(f"{type(self).__name__} is immutable")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
 
     def __str__(self) -> str:
         if self.scale == Scale.AUTO:
@@ -133,18 +144,26 @@ class LengthBase(Generic[T]):
             that scale is supported for cls.
         """
 
+        # Fast paths on the exact type for the common cases, before falling back
+        # to the generic checks below
+        _type = type(value)
+        if _type is cls:
+            # Lengths are immutable and the scale was checked on construction
+            return value
         if value is None:
             return cls.default()
+        if _type is float or _type is int:
+            return cls(Scale.POINTS, value)
         if isinstance(value, (int, float)):
             value *= PT
         if not issubclass(type(value), LengthBase):
             raise TypeError("Value is not supported/recognized: " + str(value))
-        LengthBase._check_scale(cls._type_T, value.scale)
+        cls._check_scale(value.scale)
 
         return cls(value.scale, value.value)
 
-    def to_dict(self) -> dict[str, int | float]:
-        return dict(dim=self.scale.value, value=self.value)
+    def to_tuple(self) -> tuple[int, float]:
+        return self._tuple
 
     def to_pts(self, container: Optional[float] = None) -> float:
         if self.scale == Scale.POINTS:
@@ -161,14 +180,23 @@ class LengthBase(Generic[T]):
             )
 
     def __eq__(self, __value: object) -> bool:
+        # Default and parsed lengths are shared instances, so identity is common
+        if __value is self:
+            return True
         if not isinstance(__value, LengthBase):
             return False
         return self.scale == __value.scale and (
             self.value == __value.value or (isnan(self.value) and isnan(__value.value))
         )
 
+    def __hash__(self) -> int:
+        # NaN values compare equal (see `__eq__`), so they must also hash equal
+        return hash((self.scale, None if isnan(self.value) else self.value))
+
 
 class Length(LengthBase[Scale]):
+    __slots__ = ()
+
     def __mul__(self, value):
         if self.scale not in (Scale.POINTS, Scale.PERCENT, Scale.FLEX):
             raise TypeError("Cannot multiply Length of type: " + str(self))
@@ -180,10 +208,12 @@ class Length(LengthBase[Scale]):
 
     @staticmethod
     def default() -> Length:
-        return Length(Scale.AUTO)
+        return AUTO
 
 
 class LengthAvailableSpace(LengthBase[AvailableSpace]):
+    __slots__ = ()
+
     @staticmethod
     def definite(value: float | Length) -> LengthAvailableSpace:
         if value is None:
@@ -202,7 +232,7 @@ class LengthAvailableSpace(LengthBase[AvailableSpace]):
 
     @staticmethod
     def default() -> LengthAvailableSpace:
-        return LengthAvailableSpace(AvailableSpace.MAX_CONTENT)
+        return _DEFAULT_AVAILABLE_SPACE
 
     @staticmethod
     def from_dict(value: dict[int, float]) -> LengthAvailableSpace:
@@ -228,6 +258,8 @@ class LengthPoints(LengthBase[Points]):
 
     """
 
+    __slots__ = ()
+
     @staticmethod
     def points(value: float | Length = None) -> LengthPoints:
         """Returns length using :py:obj:`Scale.POINTS <Scale>`."""
@@ -240,10 +272,12 @@ class LengthPoints(LengthBase[Points]):
 
     @staticmethod
     def default() -> LengthPoints:
-        return LengthPoints()
+        return _DEFAULT_POINTS
 
 
 class LengthPointsPercent(LengthBase[PointsPercent]):
+    __slots__ = ()
+
     @staticmethod
     def points(value: float | Length) -> LengthPointsPercent:
         if value is None:
@@ -262,10 +296,12 @@ class LengthPointsPercent(LengthBase[PointsPercent]):
 
     @staticmethod
     def default() -> LengthPointsPercent:
-        return LengthPointsPercent(PointsPercent.POINTS)
+        return _DEFAULT_POINTS_PERCENT
 
 
 class LengthPointsPercentAuto(LengthBase[PointsPercentAuto]):
+    __slots__ = ()
+
     @staticmethod
     def points(value: float | Length) -> LengthPointsPercentAuto:
         if value is None:
@@ -288,13 +324,16 @@ class LengthPointsPercentAuto(LengthBase[PointsPercentAuto]):
 
     @staticmethod
     def default() -> LengthPointsPercentAuto:
-        return LengthPointsPercentAuto(PointsPercentAuto.AUTO, NAN)
+        return _DEFAULT_POINTS_PERCENT_AUTO
 
 
-class LengthMinTrackSize(LengthBase[MinTrackSize]): ...
+class LengthMinTrackSize(LengthBase[MinTrackSize]):
+    __slots__ = ()
 
 
 class LengthMaxTrackSize(LengthBase[MaxTrackSize]):
+    __slots__ = ()
+
     @staticmethod
     def flex(value: float | Length) -> LengthMaxTrackSize:
         if value is None:
@@ -326,3 +365,10 @@ FR = Length(Scale.FLEX, 1)
 MIN_CONTENT = Length(Scale.MIN_CONTENT)
 MAX_CONTENT = Length(Scale.MAX_CONTENT)
 ZERO = Length(Scale.POINTS, 0)
+
+# Lengths are immutable, so `default()` hands out shared instances instead of
+# allocating a new one for every unspecified value.
+_DEFAULT_AVAILABLE_SPACE = LengthAvailableSpace(AvailableSpace.MAX_CONTENT)
+_DEFAULT_POINTS = LengthPoints()
+_DEFAULT_POINTS_PERCENT = LengthPointsPercent(PointsPercent.POINTS)
+_DEFAULT_POINTS_PERCENT_AUTO = LengthPointsPercentAuto(PointsPercentAuto.AUTO, NAN)
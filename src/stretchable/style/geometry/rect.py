@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Generic, TypeVar, get_args
 
 from .length import Length, LengthPointsPercent, LengthPointsPercentAuto
 
 T = TypeVar("T")
 
+# Indices into the positional values for top, right, bottom and left, following
+# the CSS shorthand convention for 1-4 values
+_SIDE_INDICES = {1: (0, 0, 0, 0), 2: (0, 1, 0, 1), 3: (0, 1, 2, 1), 4: (0, 1, 2, 3)}
+
 
 class RectBase(Generic[T]):
     _type_T: Any
@@ -30,35 +35,36 @@ class RectBase(Generic[T]):
             raise ValueError("More than 4 values is not supported")
         elif n == 0:
             top = right = bottom = left = None
-        elif n == 1:
-            top = right = bottom = left = values[0]
-        elif n == 2:
-            top = bottom = values[0]
-            left = right = values[1]
-        elif n == 3:
-            top = values[0]
-            left = right = values[1]
-            bottom = values[2]
         else:
-            top, right, bottom, left = values
+            top, right, bottom, left = map(values.__getitem__, _SIDE_INDICES[n])
         self.top: T = self._type_T.from_any(top)
         self.right: T = self._type_T.from_any(right)
         self.bottom: T = self._type_T.from_any(bottom)
         self.left: T = self._type_T.from_any(left)
 
-    def to_dict(self) -> dict[str, dict[str, float]]:
-        return dict(
-            top=self.top.to_dict(),
-            right=self.right.to_dict(),
-            bottom=self.bottom.to_dict(),
-            left=self.left.to_dict(),
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Instances are shared (see `_from_scalar` and the style defaults), so
+        # each value may only be assigned once, in `__init__`
+        if hasattr(self, name):
+            raise AttributeError(f"{type(self).__name__} is immutable")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def to_tuple(self) -> tuple[int | float, ...]:
+        """Returns the rect as a flat tuple of ``(scale, value)`` pairs in the
+        order top, right, bottom, left."""
+        return (
+            *self.top.to_tuple(),
+            *self.right.to_tuple(),
+            *self.bottom.to_tuple(),
+            *self.left.to_tuple(),
         )
 
     @classmethod
     def from_any(cls, value: Any = None) -> RectBase:
-        if value is None:
-            return cls()
-        elif isinstance(value, cls):
+        if isinstance(value, cls):
             return value
         elif issubclass(type(value), RectBase):
             # Return a new instance of cls, to cast to correct cls and ensure that
@@ -66,9 +72,19 @@ class RectBase(Generic[T]):
             return cls(value.top, value.right, value.bottom, value.left)
         elif isinstance(value, (list, tuple)):
             return cls(*value)
-        else:
+        try:
+            return cls._from_scalar(value)
+        except TypeError:
+            # Unhashable value, or not supported (raise the error from cls)
             return cls(value)
 
+    @classmethod
+    @lru_cache(maxsize=256, typed=True)
+    def _from_scalar(cls, value: Any) -> RectBase:
+        # Rects are immutable, so the same few literals (None, 0, AUTO, ...)
+        # used for every side map to shared instances
+        return cls(value)
+
     def _str(
         self,
         top: str = "top",
@@ -93,17 +109,30 @@ class RectBase(Generic[T]):
     def __str__(self) -> str:
         return self._str()
 
+    def __eq__(self, __value: object) -> bool:
+        if not isinstance(__value, RectBase):
+            return False
+        return (
+            self.top == __value.top
+            and self.right == __value.right
+            and self.bottom == __value.bottom
+            and self.left == __value.left
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.top, self.right, self.bottom, self.left))
+
 
 class Rect(RectBase[Length]):
-    pass
+    __slots__ = ()
 
 
 class RectPointsPercent(RectBase[LengthPointsPercent]):
-    pass
+    __slots__ = ()
 
 
 class RectPointsPercentAuto(RectBase[LengthPointsPercentAuto]):
-    pass
+    __slots__ = ()
 
 
 # def from_css_attrs(
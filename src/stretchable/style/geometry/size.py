@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Generic, TypeVar, get_args
 
 from .length import (
@@ -37,17 +38,24 @@ class SizeBase(Generic[T]):
         self.width: T = self._type_T.from_any(width)
         self.height: T = self._type_T.from_any(height)
 
-    def to_dict(self) -> dict[str, dict[str, float]]:
-        return dict(
-            width=self.width.to_dict(),
-            height=self.height.to_dict(),
-        )
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Instances are shared (see `_from_scalar` and the style defaults), so
+        # each value may only be assigned once, in `__init__`
+        if hasattr(self, name):
+            raise AttributeError(f"{type(self).__name__} is immutable")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def to_tuple(self) -> tuple[int | float, ...]:
+        """Returns the size as a flat tuple of ``(scale, value)`` pairs in the
+        order width, height."""
+        return (*self.width.to_tuple(), *self.height.to_tuple())
 
     @classmethod
     def from_any(cls, value: Any = None) -> SizeBase:
-        if value is None:
-            return cls()
-        elif isinstance(value, cls):
+        if isinstance(value, cls):
             return value
         elif issubclass(type(value), SizeBase):
             # Return a new instance of cls, to cast to correct cls and ensure that
@@ -55,9 +63,19 @@ class SizeBase(Generic[T]):
             return cls(value.width, value.height)
         elif isinstance(value, (list, tuple)):
             return cls(*value)
-        else:
+        try:
+            return cls._from_scalar(value)
+        except TypeError:
+            # Unhashable value, or not supported (raise the error from cls)
             return cls(value)
 
+    @classmethod
+    @lru_cache(maxsize=256, typed=True)
+    def _from_scalar(cls, value: Any) -> SizeBase:
+        # Sizes are immutable, so the same few literals (None, 0, AUTO, ...)
+        # used for both dimensions map to shared instances
+        return cls(value)
+
     @classmethod
     def default(cls) -> SizeBase:
         raise NotImplementedError
@@ -81,24 +99,29 @@ class SizeBase(Generic[T]):
             return False
         return self.width == __value.width and self.height == __value.height
 
+    def __hash__(self) -> int:
+        return hash((self.width, self.height))
+
 
 class Size(SizeBase[Length]):
-    pass
+    __slots__ = ()
 
 
 class SizePoints(SizeBase[LengthPoints]):
-    pass
+    __slots__ = ()
 
 
 class SizePointsPercent(SizeBase[LengthPointsPercent]):
-    pass
+    __slots__ = ()
 
 
 class SizePointsPercentAuto(SizeBase[LengthPointsPercentAuto]):
-    pass
+    __slots__ = ()
 
 
 class SizeAvailableSpace(SizeBase[LengthAvailableSpace]):
+    __slots__ = ()
+
     @classmethod
     def default(cls) -> SizeAvailableSpace:
         return SizeAvailableSpace(MAX_CONTENT)
@@ -2,40 +2,54 @@ from __future__ import annotations
 
 import re
 from enum import IntEnum
+from functools import lru_cache
 from typing import Any, Optional
 
-from attrs import define, field, validators
+from attrs import define, field
 
 from .geometry import length
 
 
+# Splits a list of grid tracks on spaces that are not inside parentheses
+_TRACK_SEPARATOR = re.compile(" (?![^(,]*\\))")
+
+_KEYWORD_VALUES = {
+    "auto": length.AUTO,
+    "min-content": length.MIN_CONTENT,
+    "max-content": length.MAX_CONTENT,
+}
+_UNIT_VALUES = {"px": length.PT, "fr": length.FR}
+
+
+@lru_cache(maxsize=1024)
+def _parse_single(val: str) -> length.Length | float | str:
+    # Inline styles tend to repeat a small vocabulary of values ("0", "auto",
+    # "10px", ...) and the parsed lengths are immutable, so results are shared.
+    val = val.strip().lower()
+    keyword = _KEYWORD_VALUES.get(val)
+    if keyword is not None:
+        return keyword
+    if val.endswith("%"):
+        return float(val[:-1]) * length.PCT
+    unit = _UNIT_VALUES.get(val[-2:])
+    if unit is not None:
+        return float(val[:-2]) * unit
+    try:
+        return float(val)
+    except ValueError:
+        return val
+
+
 def parse_value(
     value: str,
 ) -> length.Length | float | str | tuple[length.Length]:
-    def parse_single(val: str) -> length.Length | float | str:
-        val = val.strip().lower()
-        if val.endswith("px"):
-            return float(val.rstrip("px")) * length.PT
-        if val.endswith("%"):
-            return float(val.rstrip("%")) * length.PCT
-        if val.endswith("fr"):
-            return float(val.rstrip("fr")) * length.FR
-        if val == "auto":
-            return length.AUTO
-        if val == "min-content":
-            return length.MIN_CONTENT
-        if val == "max-content":
-            return length.MAX_CONTENT
-        try:
-            return float(val)
-        except ValueError:
-            return val
-
-    value = value.strip()
-    if " " in value:
-        return tuple(parse_single(v) for v in value.split(" "))
+    # Split on runs of whitespace once, so that repeated spaces between values
+    # do not produce empty entries
+    parts = value.split()
+    if len(parts) > 1:
+        return tuple(_parse_single(v) for v in parts)
     else:
-        return parse_single(value)
+        return _parse_single(value.strip())
 
 
 # region Layout strategy/misc
@@ -372,15 +386,15 @@ class GridTrackSize:
 
     @staticmethod
     def auto() -> GridTrackSize:
-        return GridTrackSize(length.AUTO, length.AUTO)
+        return _TRACK_AUTO
 
     @staticmethod
     def min_content() -> GridTrackSize:
-        return GridTrackSize(length.MIN_CONTENT, length.MIN_CONTENT)
+        return _TRACK_MIN_CONTENT
 
     @staticmethod
     def max_content() -> GridTrackSize:
-        return GridTrackSize(length.MAX_CONTENT, length.MAX_CONTENT)
+        return _TRACK_MAX_CONTENT
 
     @staticmethod
     def fit_content(value: length.PointsPercent | int | float) -> GridTrackSize:
@@ -388,7 +402,7 @@ class GridTrackSize:
 
     @staticmethod
     def zero() -> GridTrackSize:
-        return GridTrackSize(length.ZERO, length.ZERO)
+        return _TRACK_ZERO
 
     @staticmethod
     def points(value: length.LengthPointsPercent | int | float) -> GridTrackSize:
@@ -408,11 +422,10 @@ class GridTrackSize:
             value = length.LengthMaxTrackSize.flex(value)
         return GridTrackSize(length.AUTO, value)
 
-    def to_dict(self) -> dict:
-        return dict(
-            min_size=self.min_size.to_dict(),
-            max_size=self.max_size.to_dict(),
-        )
+    def to_tuple(self) -> tuple[int | float, ...]:
+        """Returns the track size as a flat tuple of ``(scale, value)`` pairs in
+        the order min_size, max_size."""
+        return (*self.min_size.to_tuple(), *self.max_size.to_tuple())
 
     def __str__(self) -> str:
         if (
@@ -428,6 +441,13 @@ class GridTrackSize:
         return f"minmax({self.min_size}, {self.max_size})"
 
 
+# Keyword track sizes are immutable and shared by all grid styles that use them
+_TRACK_AUTO = GridTrackSize(length.AUTO, length.AUTO)
+_TRACK_MIN_CONTENT = GridTrackSize(length.MIN_CONTENT, length.MIN_CONTENT)
+_TRACK_MAX_CONTENT = GridTrackSize(length.MAX_CONTENT, length.MAX_CONTENT)
+_TRACK_ZERO = GridTrackSize(length.ZERO, length.ZERO)
+
+
 class GridTrackRepetition(IntEnum):
     SINGLE = -2
     AUTO_FIT = -1
@@ -435,15 +455,9 @@ class GridTrackRepetition(IntEnum):
     COUNT = 1  # repeat_count
 
 
-# class GridTrackSizing(ABC):
-#     @abstractmethod
-#     def to_dict(self) -> dict:
-#         ...
-
-
 @define(frozen=True)
 class GridTrackSizing:
-    tracks: list[GridTrackSize]
+    tracks: tuple[GridTrackSize, ...] = field(converter=tuple)
     repetition: GridTrackRepetition = field(default=GridTrackRepetition.AUTO_FILL)
     count: int = field(kw_only=True, default=None)
 
@@ -506,7 +520,7 @@ class GridTrackSizing:
                 raise ValueError(
                     f"`repetition` value '{v}' should be either 'auto-fill', 'auto-fit' or a positive integer"
                 )
-        tracks = re.split(" (?![^(,]*\\))", tracks.replace(", ", ","))
+        tracks = _TRACK_SEPARATOR.split(tracks.replace(", ", ","))
         return GridTrackSizing.repeat(tracks, repetition=repetition, count=count)
 
     @staticmethod
@@ -519,22 +533,16 @@ class GridTrackSizing:
             return value
         return GridTrackSizing.single(value)
 
-    def to_dict(self) -> dict:
-        if self.repetition == GridTrackRepetition.SINGLE:
-            return dict(
-                repetition=GridTrackRepetition.SINGLE,
-                single=self.tracks[0].to_dict(),
-                repeat=[],
-            )
-
-        return dict(
-            repetition=(
+    def to_tuple(self) -> tuple[int, tuple[tuple[int | float, ...], ...]]:
+        """Returns the track sizing as ``(repetition, tracks)``, where repetition
+        is the count for ``GridTrackRepetition.COUNT``."""
+        return (
+            (
                 self.repetition
                 if self.repetition != GridTrackRepetition.COUNT
                 else self.count
             ),
-            single=None,
-            repeat=[t.to_dict() for t in self.tracks],
+            tuple(t.to_tuple() for t in self.tracks),
         )
 
     def __str__(self) -> str:
@@ -552,7 +560,7 @@ class GridIndex:
 
     @staticmethod
     def auto() -> GridIndex:
-        return GridIndex()
+        return _INDEX_AUTO
 
     @staticmethod
     def from_index(index: int) -> GridIndex:
@@ -599,25 +607,17 @@ class GridIndex:
         else:
             return GridIndexType.INDEX
 
-    def to_dict(self) -> dict[str, int]:
-        return dict(
-            kind=self.type.value,
-            value=self.value if self.value is not None else 0,
-        )
+    def to_tuple(self) -> tuple[int, int]:
+        return (self.type.value, self.value if self.value is not None else 0)
+
+
+_INDEX_AUTO = GridIndex()
 
 
 @define(frozen=True)
 class GridPlacement:
-    start: GridIndex = field(
-        default=None,
-        converter=GridIndex.from_any,
-        validator=[validators.optional(validators.instance_of(GridIndex))],
-    )
-    end: GridIndex = field(
-        default=None,
-        converter=GridIndex.from_any,
-        validator=[validators.optional(validators.instance_of(GridIndex))],
-    )
+    start: GridIndex = field(default=None, converter=GridIndex.from_any)
+    end: GridIndex = field(default=None, converter=GridIndex.from_any)
 
     @staticmethod
     def from_inline(value: str) -> GridPlacement:
@@ -638,11 +638,8 @@ class GridPlacement:
             return value
         raise TypeError("Unsupported value type")
 
-    def to_dict(self) -> dict[str, int]:
-        return dict(
-            start=self.start.to_dict(),
-            end=self.end.to_dict(),
-        )
+    def to_tuple(self) -> tuple[int, int, int, int]:
+        return (*self.start.to_tuple(), *self.end.to_tuple())
 
 
 # endregion
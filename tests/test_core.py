@@ -0,0 +1,39 @@
+import gc
+
+from stretchable import taffylib
+from stretchable.core import Taffy
+
+
+def test_taffy_lazy_init(monkeypatch):
+    calls = []
+    init = taffylib.init
+    monkeypatch.setattr(taffylib, "init", lambda: calls.append(None) or init())
+
+    taffy = Taffy()
+    assert calls == []
+    ptr = taffy._ptr
+    assert ptr and taffy._ptr == ptr
+    assert len(calls) == 1
+
+    # Once the tree has been freed, the pointer is no longer handed out
+    taffy._finalizer()
+    assert taffy._ptr is None
+    assert len(calls) == 1
+
+
+def test_taffy_free_on_collect(monkeypatch):
+    freed = []
+    free = taffylib.free
+    monkeypatch.setattr(taffylib, "free", lambda ptr: freed.append(ptr) or free(ptr))
+
+    # An unused instance never creates (or frees) a tree
+    taffy = Taffy()
+    del taffy
+    gc.collect()
+    assert freed == []
+
+    taffy = Taffy()
+    ptr = taffy._ptr
+    del taffy
+    gc.collect()
+    assert freed == [ptr]
@@ -1,6 +1,6 @@
 import pytest
 
-from stretchable import Node, Style
+from stretchable import Node, Style, taffylib
 from stretchable.exceptions import NodeNotFound
 
 
@@ -54,3 +54,77 @@ def test_node_style_setter():
     node.compute_layout()
     size = node.get_box()
     assert size.width == 300 and size.height == 200
+
+
+def test_node_from_xml_customize():
+    calls = []
+
+    def customize(node: Node, element) -> Node:
+        calls.append(
+            (
+                element.tag,
+                dict(element.attrib),
+                [(child.tag, dict(child.attrib), len(child)) for child in element],
+                len(node),
+            )
+        )
+        return node
+
+    xml = "<root key='root'><a key='a'><a1 key='a1'><x/></a1></a><b key='b'/></root>"
+    for value in (xml, xml.encode()):
+        calls.clear()
+        root = Node.from_xml(value, customize)
+
+        # Parents are customized before their children, with intact elements
+        assert calls == [
+            (
+                "root",
+                {"key": "root"},
+                [("a", {"key": "a"}, 1), ("b", {"key": "b"}, 0)],
+                0,
+            ),
+            ("a", {"key": "a"}, [("a1", {"key": "a1"}, 1)], 0),
+            ("a1", {"key": "a1"}, [("x", {}, 0)], 0),
+            ("x", {}, [], 0),
+            ("b", {"key": "b"}, [], 0),
+        ]
+        assert [node.key for node in root] == ["a", "b"]
+        assert root.find("/a/a1/0") is not None
+
+
+def test_node_extend_batched(monkeypatch):
+    calls = []
+    add_child = taffylib.node_add_child
+    add_children = taffylib.node_add_children
+
+    def node_add_child(ptr, parent, child):
+        calls.append(("node_add_child", parent, child))
+        add_child(ptr, parent, child)
+
+    def node_add_children(ptr, parent, children):
+        calls.append(("node_add_children", parent, list(children)))
+        add_children(ptr, parent, children)
+
+    monkeypatch.setattr(taffylib, "node_add_child", node_add_child)
+    monkeypatch.setattr(taffylib, "node_add_children", node_add_children)
+
+    root = Node(style=Style(size=(300, 100)))
+    children = [Node(style=Style(size=(50, 20))) for _ in range(3)]
+    root.extend(children)
+    assert calls == [
+        ("node_add_children", root._node_id, [c._node_id for c in children])
+    ]
+    assert list(root) == children
+    assert all(child.parent is root for child in children)
+
+    root.compute_layout()
+    assert [child.get_box().x for child in children] == [0, 50, 100]
+
+    # Invalid batches are rejected before anything is attached
+    calls.clear()
+    other = Node()
+    with pytest.raises(Exception):
+        root.extend([other, other])
+    with pytest.raises(Exception):
+        root.extend([Node(), children[0]])
+    assert calls == [] and len(root) == 3 and other.parent is None
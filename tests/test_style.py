@@ -0,0 +1,221 @@
+import gc
+import logging
+
+import pytest
+
+from stretchable import Edge, Node, Style
+from stretchable.style import (
+    AUTO,
+    PCT,
+    PT,
+    AlignItems,
+    AlignSelf,
+    Display,
+    FlexDirection,
+    GridPlacement,
+    Position,
+    Rect,
+    Size,
+)
+from stretchable.style.core import _INTERNED, _STYLE_STRUCT, _intern
+from stretchable.style.props import parse_value
+
+
+def test_packed_style_size():
+    # Must match PACKED_STYLE_LEN in src/lib.rs
+    assert _STYLE_STRUCT.size == 76 * 4
+    assert len(Style().to_dict()["packed"]) == _STYLE_STRUCT.size
+
+
+def test_packed_style_order():
+    # Word indices are pinned on the Rust side by
+    # `packed_style_matches_style_struct` in src/lib.rs
+    style = Style(
+        align_items=AlignItems.CENTER,
+        scrollbar_width=14,
+        inset=Rect(1, 2, 3, 4),
+        gap=Size(5, 6),
+        margin=Rect(7, 8, 9, 10),
+        border=Rect(11, 12, 13, 14),
+        padding=Rect(15, 16, 17, 18),
+        size=Size(19, 20),
+        min_size=Size(21, 22),
+        max_size=Size(23, 24),
+        flex_grow=63,
+        flex_shrink=64,
+        flex_basis=65,
+        aspect_ratio=67,
+        grid_row=GridPlacement.from_inline("2 / span 3"),
+        grid_column=GridPlacement.from_inline("4 / 5"),
+    )
+    words = _STYLE_STRUCT.unpack(style.to_dict()["packed"])
+    assert words[:14] == style._enum_values
+    assert words[5] == AlignItems.CENTER and words[6:11] == (-1,) * 5
+    assert words[14] == 14
+    assert words[15:23] == style.inset.to_tuple()
+    assert words[23:27] == style.gap.to_tuple()
+    assert words[27:35] == style.margin.to_tuple()
+    assert words[35:43] == style.border.to_tuple()
+    assert words[43:51] == style.padding.to_tuple()
+    assert words[51:55] == style.size.to_tuple()
+    assert words[55:59] == style.min_size.to_tuple()
+    assert words[59:63] == style.max_size.to_tuple()
+    assert words[63:65] == (63, 64)
+    assert words[65:67] == style.flex_basis.to_tuple()
+    assert words[67] == 67
+    assert words[68:72] == style.grid_row.to_tuple()
+    assert words[72:76] == style.grid_column.to_tuple()
+
+
+def test_packed_style_flex_layout():
+    a = Node(
+        style=Style(flex_grow=1, flex_shrink=0, flex_basis=50, margin=Rect(5, 6, 7, 8))
+    )
+    b = Node(style=Style(size=(100, None), aspect_ratio=2, align_self=AlignSelf.START))
+    root = Node(
+        a,
+        b,
+        style=Style(
+            flex_direction=FlexDirection.ROW,
+            size=(400, 300),
+            padding=Rect(10, 20, 30, 40),
+            border=Rect(1, 2, 3, 4),
+        ),
+    )
+    root.compute_layout()
+
+    box = a.get_box()
+    assert (box.x, box.y, box.width, box.height) == (52, 16, 220, 244)
+    box = b.get_box()
+    assert (box.x, box.y, box.width, box.height) == (278, 11, 100, 50)
+
+
+def test_packed_style_grid_layout():
+    child = Node(style=Style.from_inline("grid-row: 2; grid-column: 2 / span 2"))
+    root = Node(
+        Node(),
+        child,
+        style=Style.from_inline(
+            "display: grid; width: 400px; height: 200px; "
+            "grid-template-columns: 100px 1fr 50px; grid-template-rows: 40px 1fr"
+        ),
+    )
+    assert root.style.display == Display.GRID
+    root.compute_layout()
+
+    box = child.get_box()
+    assert (box.x, box.y, box.width, box.height) == (100, 40, 300, 160)
+
+
+def test_asymmetric_rects_and_size():
+    # Each side gets a distinct value, so a mix-up of tuple positions between
+    # Python and the extension shows up in the computed boxes
+    child = Node(
+        style=Style(
+            position=Position.ABSOLUTE,
+            inset=Rect(top=20, left=30),
+            size=(200, 100),
+            margin=Rect(1, 2, 3, 4),
+            border=Rect(5, 6, 7, 8),
+            padding=Rect(9, 10, 11, 12),
+        )
+    )
+    root = Node(child, style=Style(size=(500, 400)))
+    root.compute_layout()
+
+    boxes = {
+        Edge.MARGIN: (30, 20, 206, 104),
+        Edge.BORDER: (34, 21, 200, 100),
+        Edge.PADDING: (42, 26, 186, 88),
+        Edge.CONTENT: (54, 35, 164, 68),
+    }
+    for edge, expected in boxes.items():
+        box = child.get_box(edge)
+        assert (box.x, box.y, box.width, box.height) == expected, edge
+
+
+def test_rect_size_immutable():
+    rect = Rect.from_any(0)
+    assert rect is Rect.from_any(0)
+    with pytest.raises(AttributeError):
+        rect.top = 10 * PT
+    with pytest.raises(AttributeError):
+        del rect.left
+    assert rect == Rect(0)
+
+    size = Size.from_any(None)
+    assert size is Size.from_any(None)
+    with pytest.raises(AttributeError):
+        size.width = 10 * PT
+    assert size == Size()
+
+
+def test_style_defaults_immutable():
+    a, b = Style(), Style(flex_grow=1)
+    assert a.padding is b.padding and a.flex_basis is b.flex_basis
+    with pytest.raises(AttributeError):
+        a.padding.top = 10 * PT
+    with pytest.raises(AttributeError):
+        a.size.width = 10 * PT
+    with pytest.raises(AttributeError):
+        a.flex_basis.value = 10
+    assert a.padding == Rect(0) and a.to_dict() == Style().to_dict()
+
+
+def test_from_inline_warns_on_every_call(caplog):
+    style = "width: 10px; unknown-prop: 5px"
+    for _ in range(2):
+        caplog.clear()
+        with caplog.at_level(logging.WARNING, logger="stretchable"):
+            s = Style.from_inline(style)
+        assert s.size.width == 10 * PT
+        assert [r.getMessage() for r in caplog.records] == [
+            "Style property unknown-prop is not recognized/supported"
+        ]
+
+
+def test_from_inline_interning():
+    a = Style.from_inline("width: 10px; flex-grow: 1")
+    b = Style.from_inline("flex-grow: 1;  width: 10px")
+    assert a is b
+
+    # Equal values of different types are not merged
+    assert _intern(Style(flex_shrink=1)) is not _intern(Style(flex_shrink=1.0))
+
+    # Interned styles are only kept alive by their users
+    n = len(_INTERNED)
+    s = _intern(Style(flex_grow=123.0))
+    assert len(_INTERNED) == n + 1
+    del s
+    gc.collect()
+    assert len(_INTERNED) == n
+
+
+def test_from_inline_declaration_without_colon(caplog):
+    with caplog.at_level(logging.WARNING, logger="stretchable"):
+        s = Style.from_inline(" width : 10px;height 20px; ;flex-grow:2 ")
+    assert s.size.width == 10 * PT and s.size.height == AUTO
+    assert s.flex_grow == 2
+    assert [r.getMessage() for r in caplog.records] == [
+        "Style declaration height 20px could not be parsed"
+    ]
+
+
+def test_style_enum_type_check():
+    with pytest.raises(TypeError) as exc:
+        Style(display="flex")
+    assert str(exc.value) == (
+        "'display' must be <enum 'Display'> (got 'flex' that is a <class 'str'>)."
+    )
+    # Optional enums accept None, but not the plain int value of a member
+    assert Style(align_items=None).align_items is None
+    with pytest.raises(TypeError, match="'align_items' must be <enum 'AlignItems'>"):
+        Style(align_items=int(AlignItems.CENTER))
+
+
+def test_inline_values_split_on_whitespace():
+    assert parse_value("10px\t 20%") == (10 * PT, 20 * PCT)
+    assert parse_value("  auto  ") == AUTO
+    s = Style.from_inline("margin: 1px  2px\t3px   4px; gap:\t5px  6px")
+    assert s.margin == Rect(1, 2, 3, 4)
+    assert s.gap == Size(5, 6)